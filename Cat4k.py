@@ -1,21 +1,35 @@
 import os
 import sys
-import subprocess
-import platform
-import urllib.request
 import json
-import shutil
+import threading
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox
-import configparser
 import uuid
+from collections import namedtuple
 
 # Constants
 MINECRAFT_DIR = os.path.expanduser("~/.minecraft")
 VERSIONS_DIR = os.path.join(MINECRAFT_DIR, "versions")
 JAVA_DIR = os.path.expanduser("~/.catclient/java")
-VERSION_MANIFEST_URL = "https://launchermeta.mojang.com/mc/game/version_manifest.json"
+MANIFEST_CACHE_FILE = os.path.expanduser("~/.catclient/manifest_cache.json")
+VERSION_CACHE_DIR = os.path.expanduser("~/.catclient/versions")
+STATE_FILE = os.path.expanduser("~/.catclient/state.json")
+LEGACY_CONFIG_FILE = os.path.join(MINECRAFT_DIR, "catclient_config.ini")
+VERSION_MANIFEST_URL = "https://launchermeta.mojang.com/mc/game/version_manifest_v2.json"
 TLAUNCHER_AUTH_URL = "https://auth.tlauncher.org/authenticate"
+TLAUNCHER_VALIDATE_URL = "https://auth.tlauncher.org/validate"
+AUTH_CACHE_TTL = 24 * 60 * 60  # Seconds a cached token is trusted without revalidation
+AUTH_KEYS = ('accessToken', 'uuid', 'username')  # Required in a cached session
+DOWNLOAD_WORKERS = 8
+VERSIONS_TTL = 60  # Seconds the in-memory version list is reused when the server sends no max-age
+HTTP_TIMEOUT = 15  # Per-operation (connect or read) socket timeout for HTTP requests, in seconds
+AUTH_TIMEOUT = 10  # Per-operation socket timeout for TLauncher requests, in seconds
+NETWORK_TIMEOUT_MESSAGE = "Network timeout - check your connection."
+TLAUNCHER_HEADERS = {
+    'Content-Type': 'application/json',
+    'User-Agent': 'TLauncher/2.0 (Java; Windows 10)'
+}
 
 # Lunar Client-like theme
 LUNAR_THEME = {
@@ -29,50 +43,438 @@ LUNAR_THEME = {
     'input_bg': '#2a2a2a'
 }
 
+HTTPResponse = namedtuple("HTTPResponse", ["status", "reason", "headers", "data"])
+
+_http_pool = None
+_http_backend_resolved = False
+_http_pool_lock = threading.Lock()
+
+def _get_http_pool():
+    """Return the shared urllib3 pool, or None when urllib3 is not installed.
+
+    The backend is resolved once so a missing urllib3 is not looked up again on every request.
+    """
+    global _http_pool, _http_backend_resolved
+    with _http_pool_lock:
+        if not _http_backend_resolved:
+            try:
+                import urllib3
+            except ImportError:
+                pass
+            else:
+                _http_pool = urllib3.PoolManager(maxsize=DOWNLOAD_WORKERS)
+            _http_backend_resolved = True
+        return _http_pool
+
+def _is_urllib3_timeout(error):
+    """Tell real timeouts apart from refused/unresolvable connections, which subclass ConnectTimeoutError."""
+    import urllib3
+    return (isinstance(error, urllib3.exceptions.TimeoutError)
+            and not isinstance(error, urllib3.exceptions.NewConnectionError))
+
+def _pool_request(pool, method, url, timeout, **kwargs):
+    """Send a request through the urllib3 pool, raising timeouts as the builtin TimeoutError.
+
+    The timeout applies to each connect and read, not to the request as a whole; connect/read
+    retries are disabled so a stalled server is given up on after one timeout.
+    """
+    import urllib3
+    retries = urllib3.Retry(total=None, connect=0, read=0, other=0, redirect=5)
+    try:
+        return pool.request(method, url, timeout=urllib3.Timeout(connect=timeout, read=timeout),
+                            retries=retries, **kwargs)
+    except urllib3.exceptions.MaxRetryError as e:
+        if _is_urllib3_timeout(e.reason):
+            raise TimeoutError(str(e.reason)) from e
+        raise
+    except urllib3.exceptions.HTTPError as e:
+        if _is_urllib3_timeout(e):
+            raise TimeoutError(str(e)) from e
+        raise
+
+def http_request(method, url, body=None, headers=None, timeout=HTTP_TIMEOUT):
+    """Send an HTTP request and return an HTTPResponse; error statuses are returned, not raised.
+
+    Uses a shared keep-alive urllib3 pool when urllib3 is installed, plain urllib otherwise.
+    timeout is a per-operation socket timeout; timeouts from either backend are raised as the
+    builtin TimeoutError.
+    """
+    headers = {'Accept-Encoding': 'gzip', **(headers or {})}
+
+    pool = _get_http_pool()
+    if pool is not None:
+        r = _pool_request(pool, method, url, timeout, body=body, headers=headers)
+        return HTTPResponse(r.status, r.reason, r.headers, r.data)
+
+    import socket
+    import urllib.request
+    req = urllib.request.Request(url, data=body, headers=headers, method=method)
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as r:
+            return HTTPResponse(r.status, r.reason, r.headers, _decode_body(r.headers, r.read()))
+    except urllib.error.HTTPError as e:
+        return HTTPResponse(e.code, e.reason, e.headers, _decode_body(e.headers, e.read()))
+    except urllib.error.URLError as e:
+        if isinstance(e.reason, socket.timeout):
+            raise TimeoutError(str(e)) from e
+        raise
+    except socket.timeout as e:
+        raise TimeoutError(str(e)) from e
+
+def http_download(url, f, timeout=HTTP_TIMEOUT):
+    """Stream the body of a GET request into the binary file object f.
+
+    Goes through the same shared pool as http_request so downloads reuse its connections.
+    On either backend a non-200 status raises IOError and a timeout raises TimeoutError.
+    """
+    pool = _get_http_pool()
+    if pool is not None:
+        import urllib3
+        r = _pool_request(pool, 'GET', url, timeout, preload_content=False)
+        try:
+            if r.status != 200:
+                raise IOError(f"HTTP {r.status} {r.reason} for {url}")
+            for chunk in r.stream(64 * 1024):
+                f.write(chunk)
+        except urllib3.exceptions.HTTPError as e:
+            if _is_urllib3_timeout(e):
+                raise TimeoutError(str(e)) from e
+            raise
+        finally:
+            r.release_conn()
+        return
+
+    import shutil
+    import socket
+    import urllib.request
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as r:
+            shutil.copyfileobj(r, f)
+    except urllib.error.HTTPError as e:
+        raise IOError(f"HTTP {e.code} {e.reason} for {url}") from e
+    except urllib.error.URLError as e:
+        if isinstance(e.reason, socket.timeout):
+            raise TimeoutError(str(e)) from e
+        raise
+    except socket.timeout as e:
+        raise TimeoutError(str(e)) from e
+
+def write_bytes_atomic(path, data):
+    """Write data to a per-thread temp file and swap it in, so readers never see a partial file."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def write_json_atomic(path, data, **kwargs):
+    """Write data as JSON atomically, see write_bytes_atomic."""
+    write_bytes_atomic(path, json.dumps(data, **kwargs).encode())
+
+def _decode_body(headers, data):
+    """Undo gzip Content-Encoding, which urllib leaves to the caller."""
+    if headers.get('Content-Encoding') == 'gzip':
+        import gzip
+        return gzip.decompress(data)
+    return data
+
 class CatClientHDRV0(tk.Tk):
     def __init__(self):
         super().__init__()
         self.title("CatClient HDRV0")
         self.geometry("1200x700")
         self.configure(bg=LUNAR_THEME['bg'])
-        self.config = configparser.ConfigParser()
-        self.config_file = os.path.join(MINECRAFT_DIR, "catclient_config.ini")
         self.logged_in = False
         self.access_token = None
         self.username = None
         self.uuid = None
         self.versions = {}
+        self._version_ids = ()  # Cached tuple of self.versions keys for the version dropdown
+        self._version_values_hash = None  # Hash of the values last pushed to the dropdown
+        self._versions_fetched_at = 0.0
+        self._versions_ttl = VERSIONS_TTL
+        self._version_json_cache = {}  # Version id -> parsed per-version JSON
+        self._version_json_inflight = set()  # Version ids currently being prefetched
+        self._versions_loading = True  # Cleared once the background fetch succeeds or fails
+        self._state_dirty = False
+        self._state_flush_pending = False
+        self._java_path = None  # Resolved Java executable, reused for the rest of the session
         self.modpacks = ["Modpack 1", "Modpack 2", "Modpack 3"]  # Placeholder modpacks
 
-        # Load or initialize config
-        if os.path.exists(self.config_file):
-            self.config.read(self.config_file)
-        else:
-            self.config['settings'] = {'mode': 'offline', 'java_path': '', 'client_token': str(uuid.uuid4())}
-            with open(self.config_file, 'w') as f:
-                self.config.write(f)
+        # Load or initialize persisted state
+        self._state = self._load_state()
+        for key, default in (('mode', 'offline'), ('java_path', '')):
+            if key not in self._state:
+                self._state[key] = default
+                self._state_dirty = True
 
         # Ensure client_token exists
-        if 'client_token' not in self.config['settings']:
-            self.config['settings']['client_token'] = str(uuid.uuid4())
-            with open(self.config_file, 'w') as f:
-                self.config.write(f)
+        if 'client_token' not in self._state:
+            self._state['client_token'] = str(uuid.uuid4())
+            self._state_dirty = True
+        self._flush_state()
+
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
 
-        # Fetch Minecraft versions
-        self.fetch_versions()
+        # Restore a cached TLauncher session
+        self.restore_auth()
+
+        # Fetch Minecraft versions in the background so the window shows up immediately
+        threading.Thread(target=self._fetch_versions_bg, daemon=True).start()
 
         # Initialize UI
         self.init_ui()
 
+    def _load_state(self):
+        """Read the JSON state file, migrating the old INI config if there is no state yet."""
+        if os.path.exists(STATE_FILE):
+            try:
+                with open(STATE_FILE) as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                return {}  # Unreadable, start over with defaults
+        if os.path.exists(LEGACY_CONFIG_FILE):
+            import configparser
+            legacy = configparser.ConfigParser(interpolation=None)
+            legacy.read(LEGACY_CONFIG_FILE)
+            state = dict(legacy['settings']) if 'settings' in legacy else {}
+            if 'auth' in legacy:
+                # configparser lowercases option names, look them up case-insensitively
+                auth_keys = ('accessToken', 'uuid', 'username', 'issued_at')
+                state['auth'] = {k: legacy['auth'][k] for k in auth_keys if k in legacy['auth']}
+            self._state_dirty = True
+            return state
+        return {}
+
+    def schedule_state_save(self):
+        """Mark the state as changed and schedule a single debounced write."""
+        self._state_dirty = True
+        if not self._state_flush_pending:
+            self._state_flush_pending = True
+            self.after(500, self._flush_state)
+
+    def _flush_state(self):
+        """Write the state file if anything changed since the last write."""
+        self._state_flush_pending = False
+        if not self._state_dirty:
+            return
+        self._write_state_file()
+        self._state_dirty = False
+
+    def _write_state_file(self):
+        """Unconditionally write the current state to disk."""
+        write_json_atomic(STATE_FILE, self._state, indent=2)
+
+    def on_close(self):
+        """Flush pending state changes before closing the window."""
+        self._flush_state()
+        self.destroy()
+
+    def restore_auth(self):
+        """Reuse the cached TLauncher token, revalidating it in the background if stale."""
+        auth = self._state.get('auth')
+        if not isinstance(auth, dict) or not all(auth.get(k) for k in AUTH_KEYS):
+            return  # Missing or partial session, log in again
+        try:
+            issued_at = float(auth.get('issued_at', 0))
+        except (TypeError, ValueError):
+            return
+        if time.time() - issued_at < AUTH_CACHE_TTL:
+            self._set_auth(auth['accessToken'], auth['uuid'], auth['username'])
+        else:
+            client_token = self._state['client_token']
+            threading.Thread(target=self._validate_auth_bg, args=(dict(auth), client_token), daemon=True).start()
+
+    def _validate_auth_bg(self, auth, client_token):
+        """Check a stale cached token against TLauncher and restore it if still valid."""
+        if not all(auth.get(k) for k in AUTH_KEYS):
+            return
+        payload = {
+            "accessToken": auth['accessToken'],
+            "clientToken": client_token
+        }
+        try:
+            response = http_request('POST', TLAUNCHER_VALIDATE_URL, body=json.dumps(payload).encode('utf-8'),
+                                    headers=TLAUNCHER_HEADERS, timeout=AUTH_TIMEOUT)
+        except Exception as e:
+            print(f"Failed to validate cached session: {e}")
+            return
+        if response.status >= 400:
+            print(f"Cached session is no longer valid: {response.status} {response.reason}")
+            return
+        self.after(0, self._on_auth_validated, auth)
+
+    def _on_auth_validated(self, auth):
+        """Restore a revalidated session on the Tk thread."""
+        if self.logged_in:
+            return  # The user logged in manually in the meantime
+        self._set_auth(auth['accessToken'], auth['uuid'], auth['username'])
+        self.save_auth()
+
+    def _set_auth(self, access_token, uuid_, username):
+        """Mark the session as logged in."""
+        self.access_token = access_token
+        self.uuid = uuid_
+        self.username = username
+        self.logged_in = True
+
+    def save_auth(self):
+        """Persist the current session so the next start can skip logging in."""
+        self._state['auth'] = {
+            'accessToken': self.access_token,
+            'uuid': self.uuid,
+            'username': self.username,
+            'issued_at': time.time()
+        }
+        self.schedule_state_save()
+
     def fetch_versions(self):
-        """Fetch available Minecraft versions."""
+        """Fetch available Minecraft versions, revalidating the on-disk manifest cache."""
+        if self.versions and time.monotonic() - self._versions_fetched_at < self._versions_ttl:
+            return self.versions
+
+        cache = {}
+        if os.path.exists(MANIFEST_CACHE_FILE):
+            try:
+                with open(MANIFEST_CACHE_FILE) as f:
+                    cache = json.load(f)
+            except (OSError, ValueError):
+                cache = {}
+
+        headers = {}
+        if cache.get('body'):
+            if cache.get('etag'):
+                headers['If-None-Match'] = cache['etag']
+            if cache.get('last_modified'):
+                headers['If-Modified-Since'] = cache['last_modified']
+
         try:
-            with urllib.request.urlopen(VERSION_MANIFEST_URL) as response:
-                data = json.loads(response.read().decode())
-                self.versions = {v["id"]: v["url"] for v in data["versions"]}
+            response = http_request('GET', VERSION_MANIFEST_URL, headers=headers)
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to fetch versions: {e}")
-            self.versions = {}
+            if not cache.get('body'):
+                raise
+            print(f"Failed to fetch version manifest, using cached copy: {e}")
+            return self._parse_manifest(cache['body'])
+
+        if response.status == 304:
+            body = cache['body']  # Not modified, reuse the cached manifest
+        elif response.status != 200 and cache.get('body'):
+            print(f"Version manifest request failed with HTTP {response.status}, using cached copy")
+            return self._parse_manifest(cache['body'])
+        elif response.status == 200:
+            body = response.data
+            cache = {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'body': body.decode()
+            }
+            write_json_atomic(MANIFEST_CACHE_FILE, cache)
+        else:
+            raise IOError(f"HTTP {response.status} {response.reason}")
+
+        versions = self._parse_manifest(body)
+        self._versions_ttl = self._max_age(response.headers.get('Cache-Control', ''))
+        self._versions_fetched_at = time.monotonic()
+        return versions
+
+    @staticmethod
+    def _max_age(cache_control):
+        """Return the max-age from a Cache-Control header, or VERSIONS_TTL if there is none."""
+        for directive in cache_control.split(','):
+            name, _, value = directive.strip().partition('=')
+            if name.lower() == 'max-age':
+                try:
+                    return int(value)
+                except ValueError:
+                    break
+        return VERSIONS_TTL
+
+    def _parse_manifest(self, body):
+        """Build the version mapping from a manifest body (bytes or str)."""
+        entries = json.loads(body)["versions"]
+        return {v["id"]: {"url": v["url"], "sha1": v["sha1"]} for v in entries}
+
+    def _fetch_versions_bg(self):
+        """Fetch versions off the Tk thread and hand the result back to it."""
+        try:
+            versions = self.fetch_versions()
+        except TimeoutError:
+            self.after(0, self._on_versions_failed, NETWORK_TIMEOUT_MESSAGE)
+            return
+        except Exception as e:
+            self.after(0, self._on_versions_failed, f"Failed to fetch versions: {e}")
+            return
+        self.after(0, self._apply_versions, versions)
+
+    def _on_versions_failed(self, error):
+        """Report a failed version fetch; the default version can still be launched."""
+        self._versions_loading = False
+        if hasattr(self, 'version_combo'):
+            self._set_version_values((self._version_var.get(),))
+            self.version_combo.configure(state="readonly")
+        messagebox.showerror("Error", error)
+
+    def _apply_versions(self, versions):
+        """Store fetched versions and populate the version dropdown."""
+        self._versions_loading = False
+        self.versions = versions
+        self._version_ids = tuple(versions)
+        if hasattr(self, 'version_combo'):
+            self._set_version_values(self._version_ids)
+            self.version_combo.configure(state="readonly")
+            self._prefetch_version()
+
+    def _set_version_values(self, values):
+        """Update the dropdown values, skipping the Tk call when they have not changed."""
+        values_hash = hash(values)
+        if values_hash != self._version_values_hash:
+            self.version_combo.configure(values=values)
+            self._version_values_hash = values_hash
+
+    def load_version_json(self, version_id):
+        """Return the per-version JSON, from memory, the sha1-checked disk cache or the network."""
+        import hashlib
+        if version_id in self._version_json_cache:
+            return self._version_json_cache[version_id]
+
+        info = self.versions[version_id]
+        cache_path = os.path.join(VERSION_CACHE_DIR, f"{version_id}.json")
+        body = None
+        if os.path.exists(cache_path):
+            with open(cache_path, 'rb') as f:
+                body = f.read()
+            if hashlib.sha1(body).hexdigest() != info["sha1"]:
+                body = None  # Stale or corrupt, download it again
+
+        if body is None:
+            response = http_request('GET', info["url"])
+            if response.status != 200:
+                raise IOError(f"HTTP {response.status} {response.reason}")
+            body = response.data
+            if hashlib.sha1(body).hexdigest() != info["sha1"]:
+                raise ValueError(f"Checksum mismatch for version {version_id}")
+            write_bytes_atomic(cache_path, body)
+
+        data = json.loads(body)
+        self._version_json_cache[version_id] = data
+        return data
+
+    def _prefetch_version(self, event=None):
+        """Start loading the selected version's JSON so it is ready when PLAY is clicked."""
+        version = self._version_var.get()
+        if (version in self.versions and version not in self._version_json_cache
+                and version not in self._version_json_inflight):
+            self._version_json_inflight.add(version)
+            threading.Thread(target=self._prefetch_version_bg, args=(version,), daemon=True).start()
+
+    def _prefetch_version_bg(self, version):
+        """Load a version's JSON in the background; failures are retried on the next selection."""
+        try:
+            self.load_version_json(version)
+        except Exception as e:
+            print(f"Failed to prefetch {version}: {e}")
+        finally:
+            self._version_json_inflight.discard(version)
 
     def init_ui(self):
         """Set up the Lunar Client-like GUI."""
@@ -94,24 +496,29 @@ class CatClientHDRV0(tk.Tk):
         self.content_area = tk.Frame(main_container, bg=LUNAR_THEME['bg'])
         self.content_area.pack(side="left", fill="both", expand=True)
 
-        # Initialize pages
-        self.home_page = self.create_home_page()
-        self.modpacks_page = self.create_modpacks_page()
-        self.settings_page = self.create_settings_page()
+        # Pages are built on first show
+        self._page_builders = {
+            "Home": self.create_home_page,
+            "Modpacks": self.create_modpacks_page,
+            "Settings": self.create_settings_page
+        }
+        self._pages = {}
+        self._current_page = None
 
         # Show home page by default
         self.show_page("Home")
 
     def show_page(self, page_name):
-        """Switch between pages."""
-        for page in [self.home_page, self.modpacks_page, self.settings_page]:
-            page.pack_forget()
-        if page_name == "Home":
-            self.home_page.pack(fill="both", expand=True)
-        elif page_name == "Modpacks":
-            self.modpacks_page.pack(fill="both", expand=True)
-        elif page_name == "Settings":
-            self.settings_page.pack(fill="both", expand=True)
+        """Switch between pages, building the page the first time it is shown."""
+        if page_name not in self._pages:
+            self._pages[page_name] = self._page_builders[page_name]()
+        page = self._pages[page_name]
+        if page is self._current_page:
+            return
+        if self._current_page is not None:
+            self._current_page.pack_forget()
+        page.pack(fill="both", expand=True)
+        self._current_page = page
 
     def create_home_page(self):
         """Create the home page with version selection and play button."""
@@ -120,14 +527,18 @@ class CatClientHDRV0(tk.Tk):
         # Version selection
         version_label = tk.Label(frame, text="Select Version:", bg=LUNAR_THEME['bg'], fg=LUNAR_THEME['text'])
         version_label.pack(pady=5)
-        self.version_combo = ttk.Combobox(frame, values=list(self.versions.keys()), state="readonly")
+        self._version_var = tk.StringVar(value="1.20.1")  # Default version
+        # Disabled until the version list arrives, so nothing but real versions can be picked
+        self.version_combo = ttk.Combobox(frame, textvariable=self._version_var,
+                                          state="disabled" if self._versions_loading else "readonly")
         self.version_combo.pack(pady=5)
-        self.version_combo.set("1.20.1")  # Default version
+        self._set_version_values(self._version_ids)
+        self.version_combo.bind("<<ComboboxSelected>>", self._prefetch_version)
 
         # Play button
-        play_button = tk.Button(frame, text="PLAY", font=("Arial", 16, "bold"), bg=LUNAR_THEME['accent'], fg=LUNAR_THEME['text'],
+        self.play_button = tk.Button(frame, text="PLAY", font=("Arial", 16, "bold"), bg=LUNAR_THEME['accent'], fg=LUNAR_THEME['text'],
                                 command=self.prepare_and_launch)
-        play_button.pack(pady=20)
+        self.play_button.pack(pady=20)
         
         return frame
 
@@ -162,7 +573,7 @@ class CatClientHDRV0(tk.Tk):
         self.mode_combo = ttk.Combobox(auth_frame, values=["Offline Mode", "TLauncher Mode"], state="readonly")
         self.mode_combo.pack(fill="x", pady=5)
         self.mode_combo.bind("<<ComboboxSelected>>", self.update_mode)
-        self.mode_combo.set(self.config['settings']['mode'])
+        self.mode_combo.set(self._state['mode'])
 
         # TLauncher login fields
         self.auth_fields_frame = tk.Frame(auth_frame, bg=LUNAR_THEME['bg'])
@@ -172,9 +583,9 @@ class CatClientHDRV0(tk.Tk):
         tk.Label(self.auth_fields_frame, text="Password:", bg=LUNAR_THEME['bg'], fg=LUNAR_THEME['text']).pack(anchor="w")
         self.password_entry = tk.Entry(self.auth_fields_frame, show="*", bg=LUNAR_THEME['input_bg'], fg=LUNAR_THEME['text'])
         self.password_entry.pack(fill="x", pady=2)
-        login_button = tk.Button(self.auth_fields_frame, text="Login", bg=LUNAR_THEME['button'], fg=LUNAR_THEME['text'],
+        self.login_button = tk.Button(self.auth_fields_frame, text="Login", bg=LUNAR_THEME['button'], fg=LUNAR_THEME['text'],
                                  command=self.login)
-        login_button.pack(pady=5)
+        self.login_button.pack(pady=5)
         self.update_mode()
 
         return frame
@@ -182,82 +593,139 @@ class CatClientHDRV0(tk.Tk):
     def update_mode(self, event=None):
         """Update UI based on selected mode."""
         mode = self.mode_combo.get()
-        self.config['settings']['mode'] = mode
-        with open(self.config_file, 'w') as f:
-            self.config.write(f)
+        if self._state.get('mode') != mode:
+            self._state['mode'] = mode
+            self.schedule_state_save()
         if mode == "Offline Mode":
             self.auth_fields_frame.pack_forget()
         elif mode == "TLauncher Mode":
             self.auth_fields_frame.pack(fill="x", pady=10)
 
     def login(self):
-        """Authenticate with TLauncher."""
+        """Authenticate with TLauncher without blocking the UI."""
         auth_input = self.auth_entry.get()
         password = self.password_entry.get()
-        client_token = self.config['settings']['client_token']
+        client_token = self._state['client_token']
         payload = {
             "username": auth_input,
             "password": password,
             "clientToken": client_token,
             "requestUser": True
         }
+        self.login_button.config(state="disabled", text="Authenticating...")
+        threading.Thread(target=self._login_bg, args=(payload,), daemon=True).start()
+
+    def _login_bg(self, payload):
+        """Post the login request off the Tk thread and hand the result back to it."""
         try:
-            req = urllib.request.Request(
-                TLAUNCHER_AUTH_URL,
-                data=json.dumps(payload).encode('utf-8'),
-                headers={
-                    'Content-Type': 'application/json',
-                    'User-Agent': 'TLauncher/2.0 (Java; Windows 10)'
-                }
-            )
-            with urllib.request.urlopen(req) as response:
-                data = json.loads(response.read().decode())
-                print(data)  # For debugging
-                self.access_token = data['accessToken']
-                self.uuid = data['selectedProfile']['id']
-                self.username = data['selectedProfile']['name']
-                self.logged_in = True
-                messagebox.showinfo("Success", f"Logged in as {self.username}")
-        except urllib.error.HTTPError as e:
-            error_message = e.read().decode()
-            print(f"Error response: {error_message}")  # Print detailed error
-            messagebox.showerror("Error", f"Authentication failed: {e.code} {e.reason}\nDetails: {error_message}")
-            self.logged_in = False
+            response = http_request('POST', TLAUNCHER_AUTH_URL, body=json.dumps(payload).encode('utf-8'),
+                                    headers=TLAUNCHER_HEADERS, timeout=AUTH_TIMEOUT)
+            if response.status >= 400:
+                error_message = response.data.decode()
+                print(f"Error response: {error_message}")  # Print detailed error
+                error = f"Authentication failed: {response.status} {response.reason}\nDetails: {error_message}"
+                self.after(0, self._on_login_done, None, error)
+                return
+            data = json.loads(response.data.decode())
+        except TimeoutError:
+            self.after(0, self._on_login_done, None, NETWORK_TIMEOUT_MESSAGE)
+            return
         except Exception as e:
+            self.after(0, self._on_login_done, None, f"Authentication failed: {e}")
+            return
+        self.after(0, self._on_login_done, data, None)
+
+    def _on_login_done(self, data, error):
+        """Apply the login result and re-enable the Login button."""
+        self.login_button.config(state="normal", text="Login")
+        if error:
+            messagebox.showerror("Error", error)
+            self.logged_in = False
+            return
+        try:
+            self._set_auth(data['accessToken'], data['selectedProfile']['id'], data['selectedProfile']['name'])
+        except (KeyError, TypeError) as e:
             messagebox.showerror("Error", f"Authentication failed: {e}")
             self.logged_in = False
+            return
+        self.save_auth()
+        messagebox.showinfo("Success", f"Logged in as {self.username}")
 
     def install_modpack(self, modpack_name):
         """Install the selected modpack (placeholder)."""
         messagebox.showinfo("Modpack Installer", f"Installing {modpack_name}...")
         # Placeholder: Implement modpack download and installation logic here
 
+    def _download_one(self, download):
+        """Download a single (url, dest) pair through the shared HTTP pool."""
+        url, dest = download
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        tmp_path = dest + '.part'
+        try:
+            with open(tmp_path, 'wb') as f:
+                http_download(url, f)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        os.replace(tmp_path, dest)
+        return dest
+
+    def download_files(self, downloads):
+        """Download a list of (url, dest) pairs in parallel."""
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as ex:
+            return list(ex.map(self._download_one, downloads))
+
     def install_java_if_needed(self):
         """Install Zulu OpenJDK if not present (simplified)."""
+        if self._java_path:
+            return self._java_path
+        saved_path = self._state.get('java_path')
+        if saved_path and os.path.exists(saved_path):
+            self._java_path = saved_path
+            return saved_path
+
+        import platform
         if not os.path.exists(JAVA_DIR):
             os.makedirs(JAVA_DIR)
             java_url = "https://cdn.azul.com/zulu/bin/zulu17.36.17-ca-jdk17.0.4-win_x64.zip"  # Example URL
             messagebox.showinfo("Java", "Installing Zulu OpenJDK (placeholder)...")
-            # Placeholder: Download and extract Zulu OpenJDK
+            # Placeholder: Download via self.download_files([(java_url, ...)]) and extract Zulu OpenJDK
         java_path = os.path.join(JAVA_DIR, "bin", "java.exe" if platform.system() == "Windows" else "java")
-        self.config['settings']['java_path'] = java_path
-        with open(self.config_file, 'w') as f:
-            self.config.write(f)
+        if java_path != saved_path:
+            self._state['java_path'] = java_path
+            self.schedule_state_save()
+        self._java_path = java_path
         return java_path
 
     def prepare_and_launch(self):
         """Prepare and launch Minecraft."""
-        if self.config['settings']['mode'] == "TLauncher Mode" and not self.logged_in:
+        if self._state['mode'] == "TLauncher Mode" and not self.logged_in:
             messagebox.showerror("Error", "Please log in with TLauncher first.")
             return
 
-        version = self.version_combo.get()
+        if self._versions_loading:
+            messagebox.showinfo("Please wait", "Versions are still loading, try again in a moment.")
+            return
+
+        version = self._version_var.get()
         if not version:
             messagebox.showerror("Error", "Please select a version.")
             return
+        if self._version_ids and version not in self._version_ids:
+            messagebox.showerror("Error", f"Unknown version: {version}")
+            return
 
         java_path = self.install_java_if_needed()
 
+        # Use the prefetched version JSON when it is ready
+        version_json = self._version_json_cache.get(version)
+        if version_json and 'assetIndex' in version_json:
+            asset_index = version_json['assetIndex']['id']
+        else:
+            asset_index = version.split('.')[1]  # Simplified
+
         # Launch command (simplified)
         launch_cmd = [
             java_path,
@@ -268,15 +736,30 @@ class CatClientHDRV0(tk.Tk):
             "--version", version,
             "--gameDir", MINECRAFT_DIR,
             "--assetsDir", os.path.join(MINECRAFT_DIR, "assets"),
-            "--assetIndex", version.split('.')[1],  # Simplified
+            "--assetIndex", asset_index,
             "--uuid", self.uuid if self.logged_in else str(uuid.uuid4()),
             "--accessToken", self.access_token if self.logged_in else "0"
         ]
+        self.play_button.config(state="disabled")
+        threading.Thread(target=self._launch_bg, args=(launch_cmd,), daemon=True).start()
+
+    def _launch_bg(self, launch_cmd):
+        """Start the game process off the Tk thread."""
+        import subprocess
         try:
             subprocess.Popen(launch_cmd, cwd=MINECRAFT_DIR)
-            messagebox.showinfo("Success", "Minecraft is launching...")
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to launch: {e}")
+            self.after(0, self._on_launch_done, f"Failed to launch: {e}")
+            return
+        self.after(0, self._on_launch_done, None)
+
+    def _on_launch_done(self, error):
+        """Report the launch result and re-enable the PLAY button."""
+        self.play_button.config(state="normal")
+        if error:
+            messagebox.showerror("Error", error)
+        else:
+            messagebox.showinfo("Success", "Minecraft is launching...")
 
 if __name__ == "__main__":
     app = CatClientHDRV0()